@@ -102,22 +102,27 @@ class AXISimSoC(SoCCore):
 
             from verilog_axi.axi.axi_interconnect import AXIInterconnect
             self.submodules.axi_interconnect = AXIInterconnect(platform)
-            self.axi_interconnect.add_slave(s_axi=AXIInterface(data_width=32, address_width=32, id_width=8))
-            self.axi_interconnect.add_slave(s_axi=AXIInterface(data_width=32, address_width=32, id_width=8))
-            self.axi_interconnect.add_master(m_axi=AXIInterface(data_width=32, address_width=32, id_width=8), origin=0x0000_0000, size=0x0100_0000)
-            self.axi_interconnect.add_master(m_axi=AXIInterface(data_width=32, address_width=32, id_width=8), origin=0x1000_0000, size=0x0100_0000)
+            self.axi_interconnect.add_slaves([
+                (None, AXIInterface(data_width=32, address_width=32, id_width=8)),
+                (None, AXIInterface(data_width=32, address_width=32, id_width=8)),
+            ])
+            self.axi_interconnect.add_masters([
+                (None, AXIInterface(data_width=32, address_width=32, id_width=8), 0x0000_0000, 0x0100_0000),
+                (None, AXIInterface(data_width=32, address_width=32, id_width=8), 0x1000_0000, 0x0100_0000),
+            ])
 
         def axi_integration_test():
             # AXI Test Mapping.
             # -----------------
             axi_map = {
-                "axi_ram"      : 0x010000,
-                "axi_dp_ram_a" : 0x011000,
-                "axi_dp_ram_b" : 0x012000,
-                "axi_ram_reg"  : 0x013000,
-                "axi_ram_fifo" : 0x014000,
-                "axi_ram_xbar" : 0x100000,
-                "axi_ram_int"  : 0x200000,
+                "axi_ram"         : 0x010000,
+                "axi_dp_ram_a"    : 0x011000,
+                "axi_dp_ram_b"    : 0x012000,
+                "axi_ram_reg"     : 0x013000,
+                "axi_ram_fifo"    : 0x014000,
+                "axi_ram_xbar"    : 0x100000,
+                "axi_ram_int"     : 0x200000,
+                "axi_ram_int_1x1" : 0x300000,
             }
 
             # Add AXI RAM to SoC.
@@ -262,6 +267,24 @@ class AXISimSoC(SoCCore):
                 self.submodules += AXIARDebug(m_axi, name=f"M_AXI_{i}")
                 self.submodules += AXIRDebug(m_axi,  name=f"M_AXI_{i}")
 
+            # Add AXI RAM to SoC (Through 1X1 AXI Interconnect).
+            # -------------------------------------------------
+
+            # Test from LiteX BIOS similar to AXI RAM but with AXI_RAM_INT_1X1_BASE.
+
+            # 1) Create AXI interface and connect it to SoC.
+            s_axi = AXIInterface(data_width=32, address_width=32)
+            self.bus.add_slave("axi_ram_int_1x1", s_axi, region=SoCRegion(origin=axi_map["axi_ram_int_1x1"], size=0x1000))
+            # 2) Add AXIInterconnect  (1 Slave / 1 Master, direct connection).
+            from verilog_axi.axi.axi_interconnect import AXIInterconnect
+            self.submodules.axi_interconnect_1x1 = AXIInterconnect(platform)
+            self.axi_interconnect_1x1.add_slave(s_axi=s_axi)
+            m_axi = AXIInterface(data_width=32, address_width=32)
+            self.axi_interconnect_1x1.add_master(m_axi=m_axi, origin=axi_map["axi_ram_int_1x1"], size=0x1000)
+            # 3) Add AXISRAM.
+            from verilog_axi.axi.axi_ram import AXIRAM
+            self.submodules += AXIRAM(platform, m_axi, size=0x1000)
+
         axi_syntax_test()
         axi_integration_test()
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Verilog-AXI-Test
+#
+# Copyright (c) 2022 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import sys
+import unittest
+
+from migen import *
+
+from litex.soc.interconnect.axi import *
+
+from verilog_axi.axi_common import *
+from verilog_axi.axi.axi_interconnect import AXIInterconnect
+
+# Platform -----------------------------------------------------------------------------------------
+
+class Platform:
+    def __init__(self):
+        self.sources = []
+
+    def add_source(self, filename):
+        self.sources.append(filename)
+
+# AXIInterconnect Tests ----------------------------------------------------------------------------
+
+class TestAXIInterconnect(unittest.TestCase):
+    def setUp(self):
+        # AXIError disables stderr, restore it after each test.
+        self.addCleanup(setattr, sys, "stderr", sys.stderr)
+
+    def test_mismatch_reported_on_finalize(self):
+        axi_interconnect = AXIInterconnect(Platform())
+        axi_interconnect.add_slave(s_axi=AXIInterface(data_width=32, address_width=32, id_width=8))
+        # Mismatch is not reported on add...
+        axi_interconnect.add_master(m_axi=AXIInterface(data_width=64, address_width=32, id_width=8),
+            origin=0x0000_0000, size=0x0100_0000)
+        # ...but on finalize.
+        with self.assertRaises(AXIError):
+            axi_interconnect.finalize()
+
+    def test_no_interfaces(self):
+        axi_interconnect = AXIInterconnect(Platform())
+        with self.assertRaises(AXIError):
+            axi_interconnect.finalize()
+
+    def test_bulk_add(self):
+        axi_interconnect = AXIInterconnect(Platform())
+        axi_interconnect.add_slaves([])
+        axi_interconnect.add_slaves([("cpu", AXIInterface(data_width=32, address_width=32, id_width=8))])
+        axi_interconnect.add_masters((None, AXIInterface(data_width=32, address_width=32, id_width=8),
+            origin, 0x0100_0000) for origin in [0x0000_0000, 0x1000_0000])
+        self.assertEqual(list(axi_interconnect.s_axis.keys()), ["cpu"])
+        self.assertEqual(list(axi_interconnect.m_axis.keys()), ["m_axi0", "m_axi1"])
+
+    def test_bulk_add_mismatch(self):
+        axi_interconnect = AXIInterconnect(Platform())
+        axi_interconnect.add_slaves([(None, AXIInterface(data_width=32, address_width=32, id_width=8))])
+        # Mismatch is reported on bulk add and the added interfaces are removed.
+        with self.assertRaises(AXIError):
+            axi_interconnect.add_masters([
+                ("ram", AXIInterface(data_width=64, address_width=32, id_width=8), 0x0000_0000, 0x0100_0000),
+            ])
+        self.assertEqual(list(axi_interconnect.m_axis.keys()), [])
+        self.assertEqual(axi_interconnect._m_axi_list, [])
+
+    def test_1x1_direct_connection(self):
+        platform = Platform()
+        axi_interconnect = AXIInterconnect(platform)
+        axi_interconnect.add_slave(s_axi=AXIInterface(data_width=32, address_width=32, id_width=8))
+        axi_interconnect.add_master(m_axi=AXIInterface(data_width=32, address_width=32, id_width=8),
+            origin=0x0000_0000, size=0x0100_0000)
+        axi_interconnect.finalize()
+        self.assertEqual(platform.sources, [])
+        self.assertFalse(any(isinstance(s, Instance) for s in axi_interconnect._fragment.specials))
+
+    def test_1x1_id_width_mismatch(self):
+        axi_interconnect = AXIInterconnect(Platform())
+        axi_interconnect.add_slave(s_axi=AXIInterface(data_width=32, address_width=32, id_width=8))
+        axi_interconnect.add_master(m_axi=AXIInterface(data_width=32, address_width=32, id_width=4),
+            origin=0x0000_0000, size=0x0100_0000)
+        with self.assertRaises(AXIError):
+            axi_interconnect.finalize()
+
+    def test_master_region_checks(self):
+        axi_interconnect = AXIInterconnect(Platform())
+        # Size must be a power of 2.
+        with self.assertRaises(AssertionError):
+            axi_interconnect.add_master(m_axi=AXIInterface(data_width=32, address_width=32, id_width=8),
+                origin=0x0000_0000, size=0x1800)
+        # Origin must fit in the address width.
+        with self.assertRaises(AssertionError):
+            axi_interconnect.add_master(m_axi=AXIInterface(data_width=32, address_width=32, id_width=8),
+                origin=2**32, size=0x1000)
+        self.assertEqual(list(axi_interconnect.m_axis.keys()), [])
+
+if __name__ == "__main__":
+    unittest.main()
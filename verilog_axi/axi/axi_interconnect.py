@@ -7,7 +7,9 @@
 # LiteX wrapper around Alex Forencich Verilog-AXI's axi_interconnect.v.
 
 import os
-import math
+
+from itertools import chain
+from operator import attrgetter
 
 from migen import *
 
@@ -15,6 +17,52 @@ from litex.soc.interconnect.axi import *
 
 from verilog_axi.axi_common import *
 
+# AXI Interconnect Sources -------------------------------------------------------------------------
+
+_RTL_DIR = os.path.join(os.path.dirname(__file__), "..", "verilog", "rtl")
+_SOURCES = [os.path.join(_RTL_DIR, f) for f in ("arbiter.v", "priority_encoder.v", "axi_interconnect.v")]
+
+# AXI Interconnect User Parameters -----------------------------------------------------------------
+
+# FIXME: Enable it in LiteX's AXIInterface and add support.
+_USER_PARAMS = dict(
+    p_AWUSER_ENABLE = 0,
+    p_AWUSER_WIDTH  = 1,
+    p_WUSER_ENABLE  = 0,
+    p_WUSER_WIDTH   = 1,
+    p_BUSER_ENABLE  = 0,
+    p_BUSER_WIDTH   = 1,
+    p_ARUSER_ENABLE = 0,
+    p_ARUSER_WIDTH  = 1,
+    p_RUSER_ENABLE  = 0,
+    p_RUSER_WIDTH   = 1,
+)
+
+# AXI Interconnect Signals -------------------------------------------------------------------------
+
+_AXI_SIGNALS = [
+    # AW.
+    ("aw", "id"),    ("aw", "addr"), ("aw", "len"),   ("aw", "size"),  ("aw", "burst"), ("aw", "lock"),
+    ("aw", "cache"), ("aw", "prot"), ("aw", "qos"),   ("aw", "valid"), ("aw", "ready"),
+    # W.
+    ("w",  "data"),  ("w",  "strb"), ("w",  "last"),  ("w",  "valid"), ("w",  "ready"),
+    # B.
+    ("b",  "id"),    ("b",  "resp"), ("b",  "valid"), ("b",  "ready"),
+    # AR.
+    ("ar", "id"),    ("ar", "addr"), ("ar", "len"),   ("ar", "size"),  ("ar", "burst"), ("ar", "lock"),
+    ("ar", "cache"), ("ar", "prot"), ("ar", "qos"),   ("ar", "valid"), ("ar", "ready"),
+    # R.
+    ("r",  "id"),    ("r",  "data"), ("r",  "resp"),  ("r",  "last"),  ("r",  "valid"), ("r",  "ready"),
+]
+
+_get_axi_signals = attrgetter(*[f"{channel}.{field}" for channel, field in _AXI_SIGNALS])
+
+def _collect_signals(axis):
+    # Collect all channel signals of the AXI interfaces in a single pass (attrgetter/map/zip
+    # transpose the interfaces' signals to per-field tuples).
+    signals = list(zip(*map(_get_axi_signals, axis))) or [()]*len(_AXI_SIGNALS)
+    return dict(zip(_AXI_SIGNALS, signals))
+
 # AXI Interconnect Interface -----------------------------------------------------------------------
 
 class AXIInterconnectInterface:
@@ -23,21 +71,31 @@ class AXIInterconnectInterface:
         self.origin = origin
         self.size   = size
 
+        # Parameters.
+        self.clock_domain  = axi.clock_domain
+        self.address_width = len(axi.aw.addr)
+        self.data_width    = len(axi.w.data)
+        self.id_width      = len(axi.aw.id)
+
+        # Region Width (Masters only, exact since size is a power of 2, checked in add_master).
+        self.region_width = None if size is None else (size - 1).bit_length()
+
 # AXI Interconnect ---------------------------------------------------------------------------------
 
 class AXIInterconnect(Module):
     def __init__(self, platform):
-        self.logger = logging.getLogger("AXIInterconnect")
-        self.s_axis = {}
-        self.m_axis = {}
+        self.logger   = logging.getLogger("AXIInterconnect")
+        self.platform = platform
+        self.s_axis   = {}
+        self.m_axis   = {}
 
-        # Add Sources.
-        # ------------
-        self.add_sources(platform)
+        # AXI Interfaces Lists (In s_axis/m_axis order, avoids rebuilding them on finalize).
+        self._s_axi_list = []
+        self._m_axi_list = []
 
+    # Public helper (Same API as AXICrossbar), not used internally.
     def get_if_name(self, axi):
-        axi_ifs = {**self.s_axis, **self.m_axis}
-        for name, axi_if in axi_ifs.items():
+        for name, axi_if in chain(self.s_axis.items(), self.m_axis.items()):
             if axi is axi_if.axi:
                 return name
         return None
@@ -52,12 +110,13 @@ class AXIInterconnect(Module):
         assert isinstance(s_axi, AXIInterface)
         s_axi = AXIInterconnectInterface(axi=s_axi)
         self.s_axis[name] = s_axi
+        self._s_axi_list.append(s_axi.axi)
 
         # Info.
-        self.logger.info(f"Add AXI Slave {name} interface.")
+        self.logger.info("Add AXI Slave %s interface.", name)
 
-        # Check.
-        self.get_check_parameters(show=False)
+        # Check: Not done on single adds. Clock Domain/Address Width/Data Width mismatches are
+        # reported when the interconnect is finalized (or on add_slaves/add_masters bulk adds).
 
     def add_master(self, name=None, m_axi=None, origin=None, size=None):
 
@@ -70,122 +129,195 @@ class AXIInterconnect(Module):
         assert isinstance(m_axi, AXIInterface)
         assert origin is not None
         assert size   is not None
+        assert size > 0 and (size & (size - 1)) == 0, f"size 0x{size:x} must be a power of two"
+        # Origin is checked against the master's own address width: it is equal to the reference
+        # address width used to pack M_BASE_ADDR, or the mismatch is reported on finalize.
+        address_width = len(m_axi.aw.addr)
+        assert 0 <= origin < 2**address_width, \
+            f"origin 0x{origin:x} does not fit in the {address_width}-bit address width"
         m_axi = AXIInterconnectInterface(
             axi    = m_axi,
             origin = origin,
             size   = size,
         )
         self.m_axis[name] = m_axi
+        self._m_axi_list.append(m_axi.axi)
 
         # Info.
-        self.logger.info(f"Add AXI Master {name} interface.")
-        self.logger.info(f"  Origin: 0x{origin:08x}.")
-        self.logger.info(f"  Size:   0x{size:0x}.")
-
-        # Check.
-        self.get_check_parameters(show=False)
+        self.logger.info("Add AXI Master %s interface.", name)
+        self.logger.info("  Origin: 0x%08x.", origin)
+        self.logger.info("  Size:   0x%x.", size)
+
+        # Check: Not done on single adds. Clock Domain/Address Width/Data Width mismatches are
+        # reported when the interconnect is finalized (or on add_slaves/add_masters bulk adds).
+
+    def add_slaves(self, s_axis):
+        # Add Slaves ((name, s_axi) pairs, name can be None).
+        count = 0
+        try:
+            for name, s_axi in s_axis:
+                self.add_slave(name=name, s_axi=s_axi)
+                count += 1
+
+            # Check (Once for all added interfaces, nothing to check if nothing added).
+            if count:
+                self.get_check_parameters(show=False)
+
+        # Remove the added Slaves on error (Interconnect left unchanged).
+        except Exception:
+            for _ in range(count):
+                self.s_axis.popitem()
+                self._s_axi_list.pop()
+            raise
+
+    def add_masters(self, m_axis):
+        # Add Masters ((name, m_axi, origin, size) tuples, name can be None).
+        count = 0
+        try:
+            for name, m_axi, origin, size in m_axis:
+                self.add_master(name=name, m_axi=m_axi, origin=origin, size=size)
+                count += 1
+
+            # Check (Once for all added interfaces, nothing to check if nothing added).
+            if count:
+                self.get_check_parameters(show=False)
+
+        # Remove the added Masters on error (Interconnect left unchanged).
+        except Exception:
+            for _ in range(count):
+                self.m_axis.popitem()
+                self._m_axi_list.pop()
+            raise
 
     def get_check_parameters(self, show=True):
-        axi_ifs = {**self.s_axis, **self.m_axis}
-        axis    = [axi_if.axi for name, axi_if in axi_ifs.items()]
-
-        # Clock Domain.
-        self.clock_domain = clock_domain = axis[0].clock_domain
-        for i, axi in enumerate(axis):
-            if i == 0:
-                continue
+        axi_ifs = chain(self.s_axis.items(), self.m_axis.items())
+
+        # Reference Interface (Others are checked against it).
+        ref = next(axi_ifs, None)
+        if ref is None:
+            self.logger.error("{} on {}.".format(
+                colorer("No AXI interfaces", color="red"),
+                colorer("AXI Interconnect")))
+            raise AXIError()
+        ref_name, ref_if = ref
+
+        # Interfaces Info (Collected during the check pass when shown, returned to the caller).
+        s_infos = []
+        m_infos = []
+        collect = show and self.logger.isEnabledFor(logging.INFO)
+        def collect_info(name, axi_if):
+            if axi_if.origin is None:
+                s_infos.append(("  - %s.", name))
             else:
-                if axi.clock_domain != clock_domain:
+                m_infos.append(("  - %s, Origin: 0x%08x, Size: 0x%x.", name, axi_if.origin, axi_if.size))
+        if collect:
+            collect_info(ref_name, ref_if)
+
+        # Parameters.
+        self.clock_domain  = ref_if.clock_domain
+        self.address_width = ref_if.address_width
+        self.data_width    = ref_if.data_width
+        self.id_width      = ref_if.id_width # FIXME: Add check.
+
+        # Clock Domain/Address Width/Data Width (Checked in a single pass over interfaces).
+        params = [
+            ("Clock Domain",  "clock_domain"),
+            ("Address Width", "address_width"),
+            ("Data Width",    "data_width"),
+        ]
+        for name, axi_if in axi_ifs:
+            if collect:
+                collect_info(name, axi_if)
+            for desc, param in params:
+                if getattr(axi_if, param) != getattr(ref_if, param):
                     self.logger.error("{} on {} ({}: {} / {}: {}), should be {}.".format(
-                        colorer("Different Clock Domain", color="red"),
+                        colorer(f"Different {desc}", color="red"),
                         colorer("AXI interfaces."),
-                        self.get_if_name(axis[0]),
-                        colorer(clock_domain),
-                        self.get_if_name(axi),
-                        colorer(axi.clock_domain),
+                        ref_name,
+                        colorer(getattr(ref_if, param)),
+                        name,
+                        colorer(getattr(axi_if, param)),
                         colorer("the same")))
                     raise AXIError()
         if show:
-            self.logger.info(f"Clock Domain: {colorer(clock_domain)}")
-
-        # Address width.
-        self.address_width = address_width = len(axis[0].aw.addr)
-        for i, axi in enumerate(axis):
-            if i == 0:
-                continue
-            else:
-                if len(axi.aw.addr) != address_width:
-                    self.logger.error("{} on {} ({}: {} / {}: {}), should be {}.".format(
-                        colorer("Different Address Width", color="red"),
-                        colorer("AXI interfaces."),
-                        self.get_if_name(axis[0]),
-                        colorer(address_width),
-                        self.get_if_name(axi),
-                        colorer(len(axi.aw.addr)),
-                        colorer("the same")))
-                    raise AXIError()
-        if show:
-            self.logger.info(f"Address Width: {colorer(address_width)}")
-
-        # Data width.
-        self.data_width = data_width = len(axis[0].w.data)
-        for i, axi in enumerate(axis):
-            if i == 0:
-                continue
-            else:
-                if len(axi.w.data) != data_width:
-                    self.logger.error("{} on {} ({}: {} / {}: {}), should be {}.".format(
-                        colorer("Different Data Width", color="red"),
-                        colorer("AXI interfaces."),
-                        self.get_if_name(axis[0]),
-                        colorer(data_width),
-                        self.get_if_name(axi),
-                        colorer(len(axi.w.data)),
-                        colorer("the same")))
-                    raise AXIError()
-        if show:
-            self.logger.info(f"Data Width: {colorer(data_width)}")
-
-        # ID width.
-        # FIXME: Add check.
-        self.id_width = id_width = len(axis[0].aw.id)
-        if show:
-            self.logger.info(f"ID Width: {colorer(id_width)}")
+            self.logger.info("Clock Domain: %s",  colorer(self.clock_domain))
+            self.logger.info("Address Width: %s", colorer(self.address_width))
+            self.logger.info("Data Width: %s",    colorer(self.data_width))
+            self.logger.info("ID Width: %s",      colorer(self.id_width))
 
         # Burst.
         # FIXME: Add check.
 
-    def do_finalize(self):
-        # Get/Check Parameters.
-        # ---------------------
-        self.get_check_parameters()
-
+        return s_infos, m_infos
 
+    def do_finalize(self):
         # Get/Check Parameters.
         # ---------------------
-        self.logger.info(f"Finalized {len(self.s_axis)}X{len(self.m_axis)} Interconnect:")
-        self.logger.info(f"  Slaves:")
-        for s_name, s_axi in self.s_axis.items():
-            self.logger.info(f"  - {s_name}.")
-        self.logger.info(f"  Masters:")
-        for m_name, m_axi in self.m_axis.items():
-            self.logger.info(f"  - {m_name}, Origin: 0x{m_axi.origin:08x}, Size: 0x{m_axi.size:0x}.")
+        s_infos, m_infos = self.get_check_parameters()
+
+
+        # Info (Interfaces lines collected during the check pass).
+        # ---------------------------------------------------------
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Finalized %dX%d Interconnect:", len(self.s_axis), len(self.m_axis))
+            self.logger.info("  Slaves:")
+            for info in s_infos:
+                self.logger.info(*info)
+            self.logger.info("  Masters:")
+            for info in m_infos:
+                self.logger.info(*info)
+
+
+        # 1X1 Interconnect: Direct connection (No arbitration needed).
+        # -------------------------------------------------------------
+        # Note: The master's origin/size are not decoded here: all accesses are forwarded to the
+        # master and accesses outside its region no longer get a DECERR response from the core.
+        if len(self.s_axis) == 1 and len(self.m_axis) == 1:
+            (s_name, s_if), = self.s_axis.items()
+            (m_name, m_if), = self.m_axis.items()
+            # ID width is not checked by get_check_parameters but connect would silently
+            # truncate/extend IDs, so check it here.
+            if s_if.id_width != m_if.id_width:
+                self.logger.error("{} on {} ({}: {} / {}: {}), should be {}.".format(
+                    colorer("Different ID Width", color="red"),
+                    colorer("AXI interfaces."),
+                    s_name,
+                    colorer(s_if.id_width),
+                    m_name,
+                    colorer(m_if.id_width),
+                    colorer("the same")))
+                raise AXIError()
+            self.logger.warning("1X1 Interconnect: %s directly connected to %s, Origin/Size not decoded.",
+                s_name, m_name)
+            self.comb += s_if.axi.connect(m_if.axi)
+            return
 
+        # Add Sources.
+        # ------------
+        self.add_sources(self.platform)
 
         # Module instance.
         # ----------------
 
-        s_axis    = [axi_if.axi                        for axi_if in self.s_axis.values()]
-        m_axis    = [axi_if.axi                        for axi_if in self.m_axis.values()]
-        m_origins = [axi_if.origin                     for axi_if in self.m_axis.values()]
-        m_widths  = [math.ceil(math.log2(axi_if.size)) for axi_if in self.m_axis.values()]
+        s_axis = self._s_axi_list
+        m_axis = self._m_axi_list
+
+        s_signals = _collect_signals(s_axis)
+        m_signals = _collect_signals(m_axis)
 
         def format_m_params(params, width):
-            value = 0
-            for param in reversed(params):
-                value <<= width
-                value |= param
-            return Constant(value, len(params)*width)
+            # Byte-aligned width: Pack params (LSB-first) as bytes.
+            if width % 8 == 0:
+                data  = b"".join(param.to_bytes(width//8, "little") for param in params)
+                value = int.from_bytes(data, "little")
+                count = len(data)//(width//8)
+            # Else: Pack params (LSB-first) with shifts.
+            else:
+                value = count = 0
+                for param in params:
+                    value |= param << (count*width)
+                    count += 1
+            return Constant(value, count*width)
 
         self.specials += Instance("axi_interconnect",
             # Parameters.
@@ -196,21 +328,12 @@ class AXIInterconnect(Module):
             p_ADDR_WIDTH = self.address_width,
             p_ID_WIDTH   = self.id_width,
 
-            # FIXME: Enable it in LiteX's AXIInterface and add support.
-            p_AWUSER_ENABLE = 0,
-            p_AWUSER_WIDTH  = 1,
-            p_WUSER_ENABLE  = 0,
-            p_WUSER_WIDTH   = 1,
-            p_BUSER_ENABLE  = 0,
-            p_BUSER_WIDTH   = 1,
-            p_ARUSER_ENABLE = 0,
-            p_ARUSER_WIDTH  = 1,
-            p_RUSER_ENABLE  = 0,
-            p_RUSER_WIDTH   = 1,
+            # User Parameters.
+            **_USER_PARAMS,
 
             # Masters Origin/Size.
-            p_M_BASE_ADDR  = format_m_params(m_origins, self.address_width),
-            p_M_ADDR_WIDTH = format_m_params(m_widths,  32),
+            p_M_BASE_ADDR  = format_m_params((m_if.origin       for m_if in self.m_axis.values()), self.address_width),
+            p_M_ADDR_WIDTH = format_m_params((m_if.region_width for m_if in self.m_axis.values()), 32),
 
             # FIXME: Expose other parameters.
 
@@ -222,117 +345,115 @@ class AXIInterconnect(Module):
             # AXI Slave Interfaces.
             # --------------------
             # AW.
-            i_s_axi_awid     = Cat(*[s_axi.aw.id    for s_axi in s_axis]),
-            i_s_axi_awaddr   = Cat(*[s_axi.aw.addr  for s_axi in s_axis]),
-            i_s_axi_awlen    = Cat(*[s_axi.aw.len   for s_axi in s_axis]),
-            i_s_axi_awsize   = Cat(*[s_axi.aw.size  for s_axi in s_axis]),
-            i_s_axi_awburst  = Cat(*[s_axi.aw.burst for s_axi in s_axis]),
-            i_s_axi_awlock   = Cat(*[s_axi.aw.lock  for s_axi in s_axis]),
-            i_s_axi_awcache  = Cat(*[s_axi.aw.cache for s_axi in s_axis]),
-            i_s_axi_awprot   = Cat(*[s_axi.aw.prot  for s_axi in s_axis]),
-            i_s_axi_awqos    = Cat(*[s_axi.aw.qos   for s_axi in s_axis]),
+            i_s_axi_awid     = Cat(s_signals["aw", "id"]),
+            i_s_axi_awaddr   = Cat(s_signals["aw", "addr"]),
+            i_s_axi_awlen    = Cat(s_signals["aw", "len"]),
+            i_s_axi_awsize   = Cat(s_signals["aw", "size"]),
+            i_s_axi_awburst  = Cat(s_signals["aw", "burst"]),
+            i_s_axi_awlock   = Cat(s_signals["aw", "lock"]),
+            i_s_axi_awcache  = Cat(s_signals["aw", "cache"]),
+            i_s_axi_awprot   = Cat(s_signals["aw", "prot"]),
+            i_s_axi_awqos    = Cat(s_signals["aw", "qos"]),
             i_s_axi_awuser   = 0, # FIXME.
-            i_s_axi_awvalid  = Cat(*[s_axi.aw.valid for s_axi in s_axis]),
-            o_s_axi_awready  = Cat(*[s_axi.aw.ready for s_axi in s_axis]),
+            i_s_axi_awvalid  = Cat(s_signals["aw", "valid"]),
+            o_s_axi_awready  = Cat(s_signals["aw", "ready"]),
 
             # W.
-            i_s_axi_wdata    = Cat(*[s_axi.w.data   for s_axi in s_axis]),
-            i_s_axi_wstrb    = Cat(*[s_axi.w.strb   for s_axi in s_axis]),
-            i_s_axi_wlast    = Cat(*[s_axi.w.last   for s_axi in s_axis]),
+            i_s_axi_wdata    = Cat(s_signals["w", "data"]),
+            i_s_axi_wstrb    = Cat(s_signals["w", "strb"]),
+            i_s_axi_wlast    = Cat(s_signals["w", "last"]),
             i_s_axi_wuser    = 0, # FIXME.
-            i_s_axi_wvalid   = Cat(*[s_axi.w.valid  for s_axi in s_axis]),
-            o_s_axi_wready   = Cat(*[s_axi.w.ready  for s_axi in s_axis]),
+            i_s_axi_wvalid   = Cat(s_signals["w", "valid"]),
+            o_s_axi_wready   = Cat(s_signals["w", "ready"]),
 
             # B.
-            o_s_axi_bid      = Cat(*[s_axi.b.id     for s_axi in s_axis]),
-            o_s_axi_bresp    = Cat(*[s_axi.b.resp   for s_axi in s_axis]),
+            o_s_axi_bid      = Cat(s_signals["b", "id"]),
+            o_s_axi_bresp    = Cat(s_signals["b", "resp"]),
             o_s_axi_buser    = Open(), # FIXME.
-            o_s_axi_bvalid   = Cat(*[s_axi.b.valid  for s_axi in s_axis]),
-            i_s_axi_bready   = Cat(*[s_axi.b.ready  for s_axi in s_axis]),
+            o_s_axi_bvalid   = Cat(s_signals["b", "valid"]),
+            i_s_axi_bready   = Cat(s_signals["b", "ready"]),
 
             # AR.
-            i_s_axi_arid     = Cat(*[s_axi.ar.id    for s_axi in s_axis]),
-            i_s_axi_araddr   = Cat(*[s_axi.ar.addr  for s_axi in s_axis]),
-            i_s_axi_arlen    = Cat(*[s_axi.ar.len   for s_axi in s_axis]),
-            i_s_axi_arsize   = Cat(*[s_axi.ar.size  for s_axi in s_axis]),
-            i_s_axi_arburst  = Cat(*[s_axi.ar.burst for s_axi in s_axis]),
-            i_s_axi_arlock   = Cat(*[s_axi.ar.lock  for s_axi in s_axis]),
-            i_s_axi_arcache  = Cat(*[s_axi.ar.cache for s_axi in s_axis]),
-            i_s_axi_arprot   = Cat(*[s_axi.ar.prot  for s_axi in s_axis]),
-            i_s_axi_arqos    = Cat(*[s_axi.ar.qos   for s_axi in s_axis]),
+            i_s_axi_arid     = Cat(s_signals["ar", "id"]),
+            i_s_axi_araddr   = Cat(s_signals["ar", "addr"]),
+            i_s_axi_arlen    = Cat(s_signals["ar", "len"]),
+            i_s_axi_arsize   = Cat(s_signals["ar", "size"]),
+            i_s_axi_arburst  = Cat(s_signals["ar", "burst"]),
+            i_s_axi_arlock   = Cat(s_signals["ar", "lock"]),
+            i_s_axi_arcache  = Cat(s_signals["ar", "cache"]),
+            i_s_axi_arprot   = Cat(s_signals["ar", "prot"]),
+            i_s_axi_arqos    = Cat(s_signals["ar", "qos"]),
             i_s_axi_aruser   = 0, # FIXME.
-            i_s_axi_arvalid  = Cat(*[s_axi.ar.valid for s_axi in s_axis]),
-            o_s_axi_arready  = Cat(*[s_axi.ar.ready for s_axi in s_axis]),
+            i_s_axi_arvalid  = Cat(s_signals["ar", "valid"]),
+            o_s_axi_arready  = Cat(s_signals["ar", "ready"]),
 
             # R.
-            o_s_axi_rid      = Cat(*[s_axi.r.id     for s_axi in s_axis]),
-            o_s_axi_rdata    = Cat(*[s_axi.r.data   for s_axi in s_axis]),
-            o_s_axi_rresp    = Cat(*[s_axi.r.resp   for s_axi in s_axis]),
-            o_s_axi_rlast    = Cat(*[s_axi.r.last   for s_axi in s_axis]),
+            o_s_axi_rid      = Cat(s_signals["r", "id"]),
+            o_s_axi_rdata    = Cat(s_signals["r", "data"]),
+            o_s_axi_rresp    = Cat(s_signals["r", "resp"]),
+            o_s_axi_rlast    = Cat(s_signals["r", "last"]),
             o_s_axi_ruser    = Open(), # FIXME.
-            o_s_axi_rvalid   = Cat(*[s_axi.r.valid  for s_axi in s_axis]),
-            i_s_axi_rready   = Cat(*[s_axi.r.ready  for s_axi in s_axis]),
+            o_s_axi_rvalid   = Cat(s_signals["r", "valid"]),
+            i_s_axi_rready   = Cat(s_signals["r", "ready"]),
 
             # AXI Master Interfaces.
             # ----------------------
             # AW.
-            o_m_axi_awid     = Cat(*[m_axi.aw.id    for m_axi in m_axis]),
-            o_m_axi_awaddr   = Cat(*[m_axi.aw.addr  for m_axi in m_axis]),
-            o_m_axi_awlen    = Cat(*[m_axi.aw.len   for m_axi in m_axis]),
-            o_m_axi_awsize   = Cat(*[m_axi.aw.size  for m_axi in m_axis]),
-            o_m_axi_awburst  = Cat(*[m_axi.aw.burst for m_axi in m_axis]),
-            o_m_axi_awlock   = Cat(*[m_axi.aw.lock  for m_axi in m_axis]),
-            o_m_axi_awcache  = Cat(*[m_axi.aw.cache for m_axi in m_axis]),
-            o_m_axi_awprot   = Cat(*[m_axi.aw.prot  for m_axi in m_axis]),
-            o_m_axi_awqos    = Cat(*[m_axi.aw.qos   for m_axi in m_axis]),
+            o_m_axi_awid     = Cat(m_signals["aw", "id"]),
+            o_m_axi_awaddr   = Cat(m_signals["aw", "addr"]),
+            o_m_axi_awlen    = Cat(m_signals["aw", "len"]),
+            o_m_axi_awsize   = Cat(m_signals["aw", "size"]),
+            o_m_axi_awburst  = Cat(m_signals["aw", "burst"]),
+            o_m_axi_awlock   = Cat(m_signals["aw", "lock"]),
+            o_m_axi_awcache  = Cat(m_signals["aw", "cache"]),
+            o_m_axi_awprot   = Cat(m_signals["aw", "prot"]),
+            o_m_axi_awqos    = Cat(m_signals["aw", "qos"]),
             o_m_axi_awregion = Open(),
             o_m_axi_awuser   = Open(),
-            o_m_axi_awvalid  = Cat(*[m_axi.aw.valid for m_axi in m_axis]),
-            i_m_axi_awready  = Cat(*[m_axi.aw.ready for m_axi in m_axis]),
+            o_m_axi_awvalid  = Cat(m_signals["aw", "valid"]),
+            i_m_axi_awready  = Cat(m_signals["aw", "ready"]),
 
             # W.
-            o_m_axi_wdata    = Cat(*[m_axi.w.data   for m_axi in m_axis]),
-            o_m_axi_wstrb    = Cat(*[m_axi.w.strb   for m_axi in m_axis]),
-            o_m_axi_wlast    = Cat(*[m_axi.w.last   for m_axi in m_axis]),
+            o_m_axi_wdata    = Cat(m_signals["w", "data"]),
+            o_m_axi_wstrb    = Cat(m_signals["w", "strb"]),
+            o_m_axi_wlast    = Cat(m_signals["w", "last"]),
             o_m_axi_wuser    = Open(), # FIXME.
-            o_m_axi_wvalid   = Cat(*[m_axi.w.valid  for m_axi in m_axis]),
-            i_m_axi_wready   = Cat(*[m_axi.w.ready  for m_axi in m_axis]),
+            o_m_axi_wvalid   = Cat(m_signals["w", "valid"]),
+            i_m_axi_wready   = Cat(m_signals["w", "ready"]),
 
             # B.
-            i_m_axi_bid      = Cat(*[m_axi.b.id     for m_axi in m_axis]),
-            i_m_axi_bresp    = Cat(*[m_axi.b.resp   for m_axi in m_axis]),
+            i_m_axi_bid      = Cat(m_signals["b", "id"]),
+            i_m_axi_bresp    = Cat(m_signals["b", "resp"]),
             i_m_axi_buser    = 0, # FIXME.
-            i_m_axi_bvalid   = Cat(*[m_axi.b.valid  for m_axi in m_axis]),
-            o_m_axi_bready   = Cat(*[m_axi.b.ready  for m_axi in m_axis]),
+            i_m_axi_bvalid   = Cat(m_signals["b", "valid"]),
+            o_m_axi_bready   = Cat(m_signals["b", "ready"]),
 
             # AR.
-            o_m_axi_arid     = Cat(*[m_axi.ar.id    for m_axi in m_axis]),
-            o_m_axi_araddr   = Cat(*[m_axi.ar.addr  for m_axi in m_axis]),
-            o_m_axi_arlen    = Cat(*[m_axi.ar.len   for m_axi in m_axis]),
-            o_m_axi_arsize   = Cat(*[m_axi.ar.size  for m_axi in m_axis]),
-            o_m_axi_arburst  = Cat(*[m_axi.ar.burst for m_axi in m_axis]),
-            o_m_axi_arlock   = Cat(*[m_axi.ar.lock  for m_axi in m_axis]),
-            o_m_axi_arcache  = Cat(*[m_axi.ar.cache for m_axi in m_axis]),
-            o_m_axi_arprot   = Cat(*[m_axi.ar.prot  for m_axi in m_axis]),
-            o_m_axi_arqos    = Cat(*[m_axi.ar.qos   for m_axi in m_axis]),
+            o_m_axi_arid     = Cat(m_signals["ar", "id"]),
+            o_m_axi_araddr   = Cat(m_signals["ar", "addr"]),
+            o_m_axi_arlen    = Cat(m_signals["ar", "len"]),
+            o_m_axi_arsize   = Cat(m_signals["ar", "size"]),
+            o_m_axi_arburst  = Cat(m_signals["ar", "burst"]),
+            o_m_axi_arlock   = Cat(m_signals["ar", "lock"]),
+            o_m_axi_arcache  = Cat(m_signals["ar", "cache"]),
+            o_m_axi_arprot   = Cat(m_signals["ar", "prot"]),
+            o_m_axi_arqos    = Cat(m_signals["ar", "qos"]),
             o_m_axi_arregion = Open(),
             o_m_axi_aruser   = Open(),
-            o_m_axi_arvalid  = Cat(*[m_axi.ar.valid for m_axi in m_axis]),
-            i_m_axi_arready  = Cat(*[m_axi.ar.ready for m_axi in m_axis]),
+            o_m_axi_arvalid  = Cat(m_signals["ar", "valid"]),
+            i_m_axi_arready  = Cat(m_signals["ar", "ready"]),
 
             # R.
-            i_m_axi_rid      = Cat(*[m_axi.r.id     for m_axi in m_axis]),
-            i_m_axi_rdata    = Cat(*[m_axi.r.data   for m_axi in m_axis]),
-            i_m_axi_rresp    = Cat(*[m_axi.r.resp   for m_axi in m_axis]),
-            i_m_axi_rlast    = Cat(*[m_axi.r.last   for m_axi in m_axis]),
+            i_m_axi_rid      = Cat(m_signals["r", "id"]),
+            i_m_axi_rdata    = Cat(m_signals["r", "data"]),
+            i_m_axi_rresp    = Cat(m_signals["r", "resp"]),
+            i_m_axi_rlast    = Cat(m_signals["r", "last"]),
             i_m_axi_ruser    = 0, # FIXME.
-            i_m_axi_rvalid   = Cat(*[m_axi.r.valid  for m_axi in m_axis]),
-            o_m_axi_rready   = Cat(*[m_axi.r.ready  for m_axi in m_axis]),
+            i_m_axi_rvalid   = Cat(m_signals["r", "valid"]),
+            o_m_axi_rready   = Cat(m_signals["r", "ready"]),
         )
 
     @staticmethod
     def add_sources(platform):
-        rtl_dir = os.path.join(os.path.dirname(__file__), "..", "verilog", "rtl")
-        platform.add_source(os.path.join(rtl_dir, "arbiter.v"))
-        platform.add_source(os.path.join(rtl_dir, "priority_encoder.v"))
-        platform.add_source(os.path.join(rtl_dir, "axi_interconnect.v"))
+        for src in _SOURCES:
+            platform.add_source(src)